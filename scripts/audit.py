@@ -21,99 +21,265 @@ Usage:
 
     # Combined scopes
     python scripts/audit.py --category "Tooling" --inactive
+
+    # Matched count only
+    python scripts/audit.py --inactive --quiet
 """
 
 import argparse
 import csv
+import json
 import sys
+from bisect import bisect_right
 from collections import Counter, defaultdict
+from collections.abc import Iterable
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, TypedDict
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the stdlib encoder is used without it
+    orjson = None  # type: ignore[assignment]
 
 # File paths
 CSV_FILE = "THE_RESOURCES_TABLE.csv"
 
+# Columns with only a handful of distinct values; these are interned on load
+# so rows share one string object per value
+CATEGORICAL_COLUMNS = frozenset(
+    {"Category", "Sub-Category", "License", "Active", "Removed From Origin", "Stale"}
+)
+
+
+class ResourceDetail(TypedDict):
+    """Per-resource entry reported by a scoped audit."""
+
+    id: str
+    name: str
+    category: str
+    sub_category: str
+    active: str
+    license: str
+    author: str
+    primary_link: str
+    last_checked: str
+    days_since_check: int | None
+    removed_from_origin: str
+
 
 class AuditReport:
     """Container for audit results."""
 
-    def __init__(self):
+    def __init__(self) -> None:
         self.high_level: dict[str, Any] = {}
         self.scoped: dict[str, Any] = {}
         self.warnings: list[str] = []
         self.errors: list[str] = []
 
 
-def load_resources() -> tuple[list[dict[str, str]], list[str]]:
+class ResourceTable:
+    """Column-oriented view of the resources CSV.
+
+    Every column is kept as a list of values aligned by row index, so
+    aggregations can consume a whole column in one call instead of
+    visiting a dict per row. No per-row dicts are kept; ``row()`` builds
+    one on demand for the rows that are actually reported.
+    """
+
+    def __init__(self, rows: Iterable[list[str]], fieldnames: list[str]):
+        """Build the table from rows of values given in ``fieldnames`` order."""
+        self.size = 0
+        self.fieldnames = fieldnames
+        self.columns: dict[str, list[str]] = {name: [] for name in fieldnames}
+
+        # Resolve each column's position once; a repeated header keeps its
+        # last position, as csv.DictReader would
+        positions = {name: i for i, name in enumerate(fieldnames)}
+        appenders = [
+            (i, self.columns[name].append, name in CATEGORICAL_COLUMNS)
+            for name, i in positions.items()
+        ]
+        width = len(fieldnames)
+
+        # Consume the rows in a single pass so a reader can be streamed in
+        # without materializing every row first
+        for row in rows:
+            if not row:
+                continue  # Blank line
+            if len(row) < width:
+                row = row + [""] * (width - len(row))
+            for i, append, categorical in appenders:
+                append(sys.intern(row[i]) if categorical else row[i])
+            self.size += 1
+
+        self._dates: dict[str, list[datetime | None]] = {}
+        self._sorted_dates: dict[str, list[datetime]] = {}
+        self._lowered: dict[str, list[str]] = {}
+        self._indexes: dict[str, dict[str, list[int]]] = {}
+        self._masks: dict[tuple[str, str], bytearray] = {}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def column(self, name: str, default: str = "") -> list[str]:
+        """Return the values of a column, or ``default`` for every row if it is missing."""
+        if name in self.columns:
+            return self.columns[name]
+        return [default] * len(self)
+
+    def row(self, i: int) -> dict[str, str]:
+        """Return the values of row ``i`` keyed by column name."""
+        return {name: values[i] for name, values in self.columns.items()}
+
+    def lowered(self, name: str) -> list[str]:
+        """Return a column lowercased for case-insensitive matching, computed on first use."""
+        if name not in self._lowered:
+            lowered = [value.lower() for value in self.column(name)]
+            if name in CATEGORICAL_COLUMNS:
+                lowered = [sys.intern(value) for value in lowered]
+            self._lowered[name] = lowered
+        return self._lowered[name]
+
+    def true_mask(self, name: str) -> bytearray:
+        """Return a per-row 0/1 mask of a TRUE/FALSE column, computed on first use."""
+        key = ("true", name)
+        if key not in self._masks:
+            self._masks[key] = bytearray(value.upper() == "TRUE" for value in self.column(name))
+        return self._masks[key]
+
+    def missing_mask(self, name: str) -> bytearray:
+        """Return a per-row 0/1 mask of blank or NOT_FOUND values, computed on first use."""
+        key = ("missing", name)
+        if key not in self._masks:
+            self._masks[key] = bytearray(
+                not value or value == "NOT_FOUND" for value in self.column(name)
+            )
+        return self._masks[key]
+
+    def index(self, name: str) -> dict[str, list[int]]:
+        """Return a map from lowercased column value to the row indexes holding it.
+
+        Built on first use, so repeated lookups on a column skip the linear scan.
+        """
+        if name not in self._indexes:
+            index: defaultdict[str, list[int]] = defaultdict(list)
+            for i, value in enumerate(self.lowered(name)):
+                index[value].append(i)
+            self._indexes[name] = dict(index)
+        return self._indexes[name]
+
+    def dates(self, name: str) -> list[datetime | None]:
+        """Return a date column parsed with parse_date, parsing it only on first use."""
+        if name not in self._dates:
+            # Blank cells (never checked, etc.) skip the parse_date cache lookup
+            self._dates[name] = [
+                parse_date(value) if value else None for value in self.column(name)
+            ]
+        return self._dates[name]
+
+    def sorted_dates(self, name: str) -> list[datetime]:
+        """Return the valid dates of a column in ascending order, sorted on first use."""
+        if name not in self._sorted_dates:
+            self._sorted_dates[name] = sorted(d for d in self.dates(name) if d)
+        return self._sorted_dates[name]
+
+
+def load_resources() -> tuple[ResourceTable, list[str]]:
     """Load resources from CSV file."""
     csv_path = Path(CSV_FILE)
     if not csv_path.exists():
         print(f"Error: {CSV_FILE} not found")
         sys.exit(1)
 
-    with open(csv_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-        fieldnames = list(reader.fieldnames) if reader.fieldnames else []
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, [])
+        table = ResourceTable(reader, fieldnames)
 
-    return rows, fieldnames
+    return table, fieldnames
 
 
+@lru_cache(maxsize=100_000)
 def parse_date(date_str: str) -> datetime | None:
-    """Parse date string in format YYYY-MM-DD:HH-MM-SS."""
-    if not date_str or date_str.strip() == "":
+    """Parse date string in format YYYY-MM-DD:HH-MM-SS.
+
+    Results are cached, as the same timestamps come up again on every audit.
+    """
+    if not date_str or date_str.isspace():
         return None
+
+    # Fast path: rewrite a well-formed timestamp as ISO 8601 and hand it to the
+    # C-implemented fromisoformat, leaving anything unusual to strptime
+    if (
+        len(date_str) == 19
+        and date_str[10] == ":"
+        and date_str[4] == date_str[7] == date_str[13] == date_str[16] == "-"
+    ):
+        try:
+            return datetime.fromisoformat(
+                f"{date_str[:10]}T{date_str[11:13]}:{date_str[14:16]}:{date_str[17:]}"
+            )
+        except ValueError:
+            pass
+
     try:
         return datetime.strptime(date_str, "%Y-%m-%d:%H-%M-%S")
     except ValueError:
         return None
 
 
-def high_level_audit(resources: list[dict[str, str]]) -> dict[str, Any]:
-    """Perform high-level audit of all resources."""
+def freshness_counts(resources: ResourceTable, now: datetime) -> tuple[int, int, int, int]:
+    """Count resources added in the last 30 days and checked recently, never or long ago.
+
+    Returns ``(recently_added, recently_checked, never_checked, outdated)``. Each count
+    is a binary search over the sorted date columns rather than a scan of every row.
+    ``(now - d).days <= N`` holds exactly when ``d > now - (N + 1) days``, so the
+    cutoffs below match the day-based thresholds in the report.
+    """
+    within_30_days = now - timedelta(days=31)
+    within_7_days = now - timedelta(days=8)
+    added = resources.sorted_dates("Date Added")
+    checked = resources.sorted_dates("Last Checked")
+
+    recently_added = len(added) - bisect_right(added, within_30_days)
+    recently_checked = len(checked) - bisect_right(checked, within_7_days)
+    never_checked = len(resources) - len(checked)
+    outdated = bisect_right(checked, within_30_days)  # Not checked in 30+ days
+    return recently_added, recently_checked, never_checked, outdated
+
+
+def high_level_audit(resources: ResourceTable, now: datetime | None = None) -> dict[str, Any]:
+    """Perform high-level audit of all resources.
+
+    Freshness is measured against ``now``, which defaults to the current time.
+    """
+    if now is None:
+        now = datetime.now()
     total = len(resources)
-    active = sum(1 for r in resources if r.get("Active", "").upper() == "TRUE")
-    inactive = total - active
 
     # Category breakdown
-    categories = Counter(r.get("Category", "Unknown") for r in resources)
-    sub_categories = Counter(r.get("Sub-Category", "Unknown") for r in resources)
+    categories = Counter(resources.column("Category", "Unknown"))
+    sub_categories = Counter(resources.column("Sub-Category", "Unknown"))
 
     # License breakdown
-    licenses = Counter(r.get("License", "Unknown") for r in resources)
-    no_license = sum(
-        1 for r in resources if not r.get("License") or r.get("License") == "NOT_FOUND"
-    )
+    licenses = Counter(resources.column("License", "Unknown"))
+    no_license = resources.missing_mask("License").count(1)
 
     # Author breakdown
-    authors = Counter(r.get("Author Name", "Unknown") for r in resources)
+    authors = Counter(resources.column("Author Name", "Unknown"))
     unique_authors = len([a for a in authors if a != "Unknown"])
 
+    # Status flags
+    active = resources.true_mask("Active").count(1)
+    inactive = total - active
+    removed_from_origin = resources.true_mask("Removed From Origin").count(1)
+
     # Date analysis
-    now = datetime.now()
-    recently_added = []
-    recently_checked = []
-    never_checked = []
-    outdated = []  # Not checked in 30+ days
-
-    for resource in resources:
-        date_added = parse_date(resource.get("Date Added", ""))
-        if date_added and (now - date_added).days <= 30:
-            recently_added.append(resource)
-
-        last_checked = parse_date(resource.get("Last Checked", ""))
-        if not last_checked:
-            never_checked.append(resource)
-        elif (now - last_checked).days <= 7:
-            recently_checked.append(resource)
-        elif (now - last_checked).days > 30:
-            outdated.append(resource)
-
-    # Links with issues
-    removed_from_origin = sum(
-        1 for r in resources if r.get("Removed From Origin", "").upper() == "TRUE"
-    )
+    recently_added, recently_checked, never_checked, outdated = freshness_counts(resources, now)
 
     return {
         "total_resources": total,
@@ -125,16 +291,16 @@ def high_level_audit(resources: list[dict[str, str]]) -> dict[str, Any]:
         "no_license": no_license,
         "unique_authors": unique_authors,
         "top_authors": dict(authors.most_common(10)),
-        "recently_added": len(recently_added),
-        "recently_checked": len(recently_checked),
-        "never_checked": len(never_checked),
-        "outdated_checks": len(outdated),
+        "recently_added": recently_added,
+        "recently_checked": recently_checked,
+        "never_checked": never_checked,
+        "outdated_checks": outdated,
         "removed_from_origin": removed_from_origin,
     }
 
 
 def scoped_audit(
-    resources: list[dict[str, str]],
+    resources: ResourceTable,
     category: str | None = None,
     sub_category: str | None = None,
     author: str | None = None,
@@ -142,48 +308,81 @@ def scoped_audit(
     inactive_only: bool = False,
     no_license_only: bool = False,
     recent_days: int | None = None,
+    now: datetime | None = None,
+    include_details: bool = True,
 ) -> dict[str, Any]:
-    """Perform scoped audit based on filters."""
-    filtered = resources
-
-    # Apply filters
-    if category:
-        filtered = [r for r in filtered if r.get("Category", "").lower() == category.lower()]
-
-    if sub_category:
-        filtered = [
-            r for r in filtered if r.get("Sub-Category", "").lower() == sub_category.lower()
-        ]
-
-    if author:
-        filtered = [r for r in filtered if r.get("Author Name", "").lower() == author.lower()]
-
-    if license_filter:
-        filtered = [
-            r for r in filtered if r.get("License", "").lower() == license_filter.lower()
-        ]
-
-    if inactive_only:
-        filtered = [r for r in filtered if r.get("Active", "").upper() != "TRUE"]
-
-    if no_license_only:
+    """Perform scoped audit based on filters.
+
+    Ages and the ``recent_days`` cutoff are measured against ``now``, which
+    defaults to the current time. With ``include_details`` off only the
+    matched count is reported and ``resources`` is left empty.
+    """
+    if now is None:
+        now = datetime.now()
+
+    # Equality filters are looked up in per-column indexes; the remaining
+    # filters then narrow the matched row indexes with a scan
+    filtered: list[int] | None = None
+    for name, value in (
+        ("Category", category),
+        ("Sub-Category", sub_category),
+        ("Author Name", author),
+        ("License", license_filter),
+    ):
+        if not value:
+            continue
+        matches = resources.index(name).get(value.lower(), [])
+        if filtered is None:
+            # Copy, so nothing done to the result can change the cached index
+            filtered = list(matches)
+        else:
+            keep = set(matches)
+            filtered = [i for i in filtered if i in keep]
+
+    if filtered is None:
+        filtered = list(range(len(resources)))
+
+    # The remaining filters are checked together, so the matched rows are
+    # scanned once however many of them are set
+    if inactive_only or no_license_only or recent_days is not None:
+        active = resources.true_mask("Active") if inactive_only else bytearray()
+        no_license = resources.missing_mask("License") if no_license_only else bytearray()
+        added = resources.dates("Date Added") if recent_days is not None else []
+        cutoff_date = now - timedelta(days=recent_days or 0)
         filtered = [
-            r
-            for r in filtered
-            if not r.get("License") or r.get("License") == "NOT_FOUND"
+            i
+            for i in filtered
+            if (not inactive_only or not active[i])
+            and (not no_license_only or no_license[i])
+            and (recent_days is None or ((d := added[i]) is not None and d >= cutoff_date))
         ]
 
-    if recent_days is not None:
-        cutoff_date = datetime.now() - timedelta(days=recent_days)
-        filtered = [
-            r
-            for r in filtered
-            if parse_date(r.get("Date Added", ""))
-            and parse_date(r.get("Date Added", "")) >= cutoff_date
-        ]
+    # Add detailed info for each matched resource, unless only the count is wanted
+    details: list[ResourceDetail] = []
+    if include_details:
+        checked = resources.dates("Last Checked")
+        for i in filtered:
+            resource = resources.row(i)
+            last_checked = checked[i]
+            days_since_check = (now - last_checked).days if last_checked else None
+
+            details.append(
+                {
+                    "id": resource.get("ID", ""),
+                    "name": resource.get("Display Name", ""),
+                    "category": resource.get("Category", ""),
+                    "sub_category": resource.get("Sub-Category", ""),
+                    "active": resource.get("Active", ""),
+                    "license": resource.get("License", ""),
+                    "author": resource.get("Author Name", ""),
+                    "primary_link": resource.get("Primary Link", ""),
+                    "last_checked": resource.get("Last Checked", ""),
+                    "days_since_check": days_since_check,
+                    "removed_from_origin": resource.get("Removed From Origin", ""),
+                }
+            )
 
-    # Analyze filtered resources
-    result = {
+    return {
         "filter_criteria": {
             "category": category,
             "sub_category": sub_category,
@@ -194,88 +393,69 @@ def scoped_audit(
             "recent_days": recent_days,
         },
         "matched_count": len(filtered),
-        "resources": [],
+        "resources": details,
     }
 
-    # Add detailed info for each matched resource
-    for resource in filtered:
-        last_checked = parse_date(resource.get("Last Checked", ""))
-        days_since_check = (
-            (datetime.now() - last_checked).days if last_checked else None
-        )
-
-        result["resources"].append(
-            {
-                "id": resource.get("ID", ""),
-                "name": resource.get("Display Name", ""),
-                "category": resource.get("Category", ""),
-                "sub_category": resource.get("Sub-Category", ""),
-                "active": resource.get("Active", ""),
-                "license": resource.get("License", ""),
-                "author": resource.get("Author Name", ""),
-                "primary_link": resource.get("Primary Link", ""),
-                "last_checked": resource.get("Last Checked", ""),
-                "days_since_check": days_since_check,
-                "removed_from_origin": resource.get("Removed From Origin", ""),
-            }
-        )
-
-    return result
-
 
 def print_high_level_report(audit_data: dict[str, Any]) -> None:
     """Print high-level audit report."""
-    print("\n" + "=" * 80)
-    print("HIGH-LEVEL AUDIT REPORT")
-    print("=" * 80)
-
-    print(f"\n📊 OVERVIEW")
-    print(f"  Total Resources: {audit_data['total_resources']}")
-    print(f"  Active: {audit_data['active']} ({audit_data['active']/audit_data['total_resources']*100:.1f}%)")
-    print(f"  Inactive: {audit_data['inactive']} ({audit_data['inactive']/audit_data['total_resources']*100:.1f}%)")
-    print(f"  Unique Authors: {audit_data['unique_authors']}")
+    lines: list[str] = []
+    lines.append("\n" + "=" * 80)
+    lines.append("HIGH-LEVEL AUDIT REPORT")
+    lines.append("=" * 80)
+
+    lines.append("\n📊 OVERVIEW")
+    lines.append(f"  Total Resources: {audit_data['total_resources']}")
+    total = audit_data["total_resources"]
+    lines.append(f"  Active: {audit_data['active']} ({audit_data['active'] / total * 100:.1f}%)")
+    lines.append(
+        f"  Inactive: {audit_data['inactive']} ({audit_data['inactive'] / total * 100:.1f}%)"
+    )
+    lines.append(f"  Unique Authors: {audit_data['unique_authors']}")
 
-    print(f"\n📁 CATEGORIES ({len(audit_data['categories'])} total)")
+    lines.append(f"\n📁 CATEGORIES ({len(audit_data['categories'])} total)")
     for cat, count in audit_data["categories"].items():
-        print(f"  {cat}: {count}")
+        lines.append(f"  {cat}: {count}")
 
-    print(f"\n📂 SUB-CATEGORIES ({len(audit_data['sub_categories'])} total)")
-    for subcat, count in list(audit_data["sub_categories"].items())[:10]:
-        print(f"  {subcat}: {count}")
+    lines.append(f"\n📂 SUB-CATEGORIES ({len(audit_data['sub_categories'])} total)")
+    for subcat, count in islice(audit_data["sub_categories"].items(), 10):
+        lines.append(f"  {subcat}: {count}")
     if len(audit_data["sub_categories"]) > 10:
-        print(f"  ... and {len(audit_data['sub_categories']) - 10} more")
+        lines.append(f"  ... and {len(audit_data['sub_categories']) - 10} more")
 
-    print(f"\n⚖️  LICENSES")
-    print(f"  Resources without license: {audit_data['no_license']}")
-    print(f"  Top licenses:")
-    for lic, count in list(audit_data["licenses"].items())[:10]:
+    lines.append("\n⚖️  LICENSES")
+    lines.append(f"  Resources without license: {audit_data['no_license']}")
+    lines.append("  Top licenses:")
+    for lic, count in islice(audit_data["licenses"].items(), 10):
         if lic not in ["NOT_FOUND", "Unknown", ""]:
-            print(f"    {lic}: {count}")
+            lines.append(f"    {lic}: {count}")
 
-    print(f"\n👥 TOP AUTHORS")
-    for author, count in list(audit_data["top_authors"].items())[:10]:
+    lines.append("\n👥 TOP AUTHORS")
+    for author, count in islice(audit_data["top_authors"].items(), 10):
         if author != "Unknown":
-            print(f"  {author}: {count} resources")
+            lines.append(f"  {author}: {count} resources")
 
-    print(f"\n📅 FRESHNESS")
-    print(f"  Recently added (last 30 days): {audit_data['recently_added']}")
-    print(f"  Recently checked (last 7 days): {audit_data['recently_checked']}")
-    print(f"  Never checked: {audit_data['never_checked']}")
-    print(f"  Outdated checks (>30 days): {audit_data['outdated_checks']}")
+    lines.append("\n📅 FRESHNESS")
+    lines.append(f"  Recently added (last 30 days): {audit_data['recently_added']}")
+    lines.append(f"  Recently checked (last 7 days): {audit_data['recently_checked']}")
+    lines.append(f"  Never checked: {audit_data['never_checked']}")
+    lines.append(f"  Outdated checks (>30 days): {audit_data['outdated_checks']}")
 
-    print(f"\n⚠️  ISSUES")
-    print(f"  Removed from origin: {audit_data['removed_from_origin']}")
+    lines.append("\n⚠️  ISSUES")
+    lines.append(f"  Removed from origin: {audit_data['removed_from_origin']}")
 
-    print("\n" + "=" * 80 + "\n")
+    lines.append("\n" + "=" * 80 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_scoped_report(scoped_data: dict[str, Any]) -> None:
     """Print scoped audit report."""
-    print("\n" + "=" * 80)
-    print("SCOPED AUDIT REPORT")
-    print("=" * 80)
+    lines: list[str] = []
+    lines.append("\n" + "=" * 80)
+    lines.append("SCOPED AUDIT REPORT")
+    lines.append("=" * 80)
 
-    print(f"\n🔍 FILTER CRITERIA:")
+    lines.append("\n🔍 FILTER CRITERIA:")
     criteria = scoped_data["filter_criteria"]
     active_filters = []
     for key, value in criteria.items():
@@ -283,14 +463,14 @@ def print_scoped_report(scoped_data: dict[str, Any]) -> None:
             active_filters.append(f"  {key.replace('_', ' ').title()}: {value}")
 
     if active_filters:
-        print("\n".join(active_filters))
+        lines.extend(active_filters)
     else:
-        print("  No filters applied")
+        lines.append("  No filters applied")
 
-    print(f"\n📊 MATCHED: {scoped_data['matched_count']} resources")
+    lines.append(f"\n📊 MATCHED: {scoped_data['matched_count']} resources")
 
-    if scoped_data["matched_count"] > 0:
-        print(f"\n📋 RESOURCES:")
+    if scoped_data["resources"]:
+        lines.append("\n📋 RESOURCES:")
         for i, resource in enumerate(scoped_data["resources"], 1):
             status = "✓" if resource["active"] == "TRUE" else "✗"
             days = (
@@ -299,19 +479,38 @@ def print_scoped_report(scoped_data: dict[str, Any]) -> None:
                 else "(never checked)"
             )
 
-            print(f"\n  {i}. {status} {resource['name']}")
-            print(f"     Category: {resource['category']} / {resource['sub_category']}")
-            print(f"     Author: {resource['author']}")
-            print(f"     License: {resource['license']}")
-            print(f"     Link: {resource['primary_link']}")
-            print(f"     Last Checked: {resource['last_checked']} {days}")
+            lines.append(f"\n  {i}. {status} {resource['name']}")
+            lines.append(f"     Category: {resource['category']} / {resource['sub_category']}")
+            lines.append(f"     Author: {resource['author']}")
+            lines.append(f"     License: {resource['license']}")
+            lines.append(f"     Link: {resource['primary_link']}")
+            lines.append(f"     Last Checked: {resource['last_checked']} {days}")
             if resource["removed_from_origin"] == "TRUE":
-                print(f"     ⚠️  REMOVED FROM ORIGIN")
+                lines.append("     ⚠️  REMOVED FROM ORIGIN")
+
+    lines.append("\n" + "=" * 80 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def to_json(data: dict[str, Any]) -> bytes:
+    """Serialize audit results as indented UTF-8 JSON, using orjson when it is installed.
 
-    print("\n" + "=" * 80 + "\n")
+    Both encoders produce the same bytes: non-ASCII text is written as UTF-8
+    rather than ``\\u`` escapes, since orjson cannot escape it.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
 
 
-def main():
+def write_json(data: dict[str, Any]) -> None:
+    """Write audit results to stdout as JSON, independent of the terminal encoding."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(to_json(data) + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def main() -> None:
     """Main entry point."""
     parser = argparse.ArgumentParser(
         description="Audit the Awesome Claude Code repository",
@@ -332,6 +531,9 @@ Examples:
 
   # Combined scopes
   python scripts/audit.py --category "Tooling" --inactive
+
+  # Matched count only
+  python scripts/audit.py --inactive --quiet
         """,
     )
 
@@ -354,6 +556,11 @@ Examples:
     parser.add_argument(
         "--json", action="store_true", help="Output in JSON format"
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only report the number of matched resources in scoped audits",
+    )
 
     args = parser.parse_args()
 
@@ -384,12 +591,11 @@ Examples:
             inactive_only=args.inactive,
             no_license_only=args.no_license,
             recent_days=args.recent_days,
+            include_details=args.json or not args.quiet,
         )
 
         if args.json:
-            import json
-
-            print(json.dumps(scoped_data, indent=2))
+            write_json(scoped_data)
         else:
             print_scoped_report(scoped_data)
     else:
@@ -397,9 +603,7 @@ Examples:
         high_level_data = high_level_audit(resources)
 
         if args.json:
-            import json
-
-            print(json.dumps(high_level_data, indent=2))
+            write_json(high_level_data)
         else:
             print_high_level_report(high_level_data)
 
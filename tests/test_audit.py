@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Unit tests for audit.py script.
+
+Tests cover:
+- Loading the resources CSV into a column table
+- High-level statistics
+- Scoped filters, alone and combined
+"""
+
+import csv
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+# Add parent directory to path to import the script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scripts.audit import (  # noqa: E402
+    ResourceTable,
+    freshness_counts,
+    high_level_audit,
+    load_resources,
+    parse_date,
+    print_high_level_report,
+    print_scoped_report,
+    scoped_audit,
+    to_json,
+)
+
+FIELDNAMES = [
+    "ID",
+    "Display Name",
+    "Category",
+    "Sub-Category",
+    "Primary Link",
+    "Author Name",
+    "Active",
+    "Date Added",
+    "Last Checked",
+    "License",
+    "Removed From Origin",
+]
+
+
+def stamp(days_ago: int) -> str:
+    """Format a timestamp ``days_ago`` days in the past the way the CSV stores it."""
+    return (datetime.now() - timedelta(days=days_ago)).strftime("%Y-%m-%d:%H-%M-%S")
+
+
+@pytest.fixture
+def sample_rows() -> list[dict[str, str]]:
+    """Sample resource rows for testing."""
+    return [
+        {
+            "ID": "cmd-001",
+            "Display Name": "Commit Helper",
+            "Category": "Slash-Commands",
+            "Sub-Category": "Version Control & Git",
+            "Primary Link": "https://example.com/commit",
+            "Author Name": "alice",
+            "Active": "TRUE",
+            "Date Added": stamp(3),
+            "Last Checked": stamp(1),
+            "License": "MIT",
+            "Removed From Origin": "FALSE",
+        },
+        {
+            "ID": "cmd-002",
+            "Display Name": "Test Runner",
+            "Category": "Slash-Commands",
+            "Sub-Category": "Code Analysis & Testing",
+            "Primary Link": "https://example.com/test",
+            "Author Name": "Alice",
+            "Active": "FALSE",
+            "Date Added": stamp(90),
+            "Last Checked": stamp(45),
+            "License": "NOT_FOUND",
+            "Removed From Origin": "TRUE",
+        },
+        {
+            "ID": "tool-001",
+            "Display Name": "Usage Monitor",
+            "Category": "Tooling",
+            "Sub-Category": "General",
+            "Primary Link": "https://example.com/usage",
+            "Author Name": "bob",
+            "Active": "TRUE",
+            "Date Added": stamp(200),
+            "Last Checked": "",
+            "License": "Apache-2.0",
+            "Removed From Origin": "FALSE",
+        },
+        {
+            "ID": "hook-001",
+            "Display Name": "Notify Hook",
+            "Category": "Hooks",
+            "Sub-Category": "General",
+            "Primary Link": "https://example.com/notify",
+            "Author Name": "carol",
+            "Active": "true",
+            "Date Added": "not a date",
+            "Last Checked": stamp(15),
+            "License": "",
+            "Removed From Origin": "FALSE",
+        },
+    ]
+
+
+@pytest.fixture
+def resources(tmp_path: Path, sample_rows: list[dict[str, str]]) -> ResourceTable:
+    """Write the sample rows to a CSV and load them through load_resources."""
+    csv_path = tmp_path / "resources.csv"
+    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(sample_rows)
+
+    with patch("scripts.audit.CSV_FILE", str(csv_path)):
+        table, _ = load_resources()
+    return table
+
+
+def test_load_resources(resources: ResourceTable) -> None:
+    """Test that every CSV column is loaded in row order."""
+    assert len(resources) == 4
+    assert resources.fieldnames == FIELDNAMES
+    assert resources.column("ID") == ["cmd-001", "cmd-002", "tool-001", "hook-001"]
+    assert resources.column("Stale", "Unknown") == ["Unknown"] * 4
+    assert resources.row(2)["Display Name"] == "Usage Monitor"
+    assert list(resources.row(2)) == FIELDNAMES
+
+
+def test_table_from_stream(sample_rows: list[dict[str, str]]) -> None:
+    """Test that a table can be built from a one-shot iterator of rows."""
+    table = ResourceTable(iter([list(row.values()) for row in sample_rows]), FIELDNAMES)
+
+    assert len(table) == 4
+    assert table.column("Author Name") == ["alice", "Alice", "bob", "carol"]
+
+
+def test_categorical_columns_interned(resources: ResourceTable) -> None:
+    """Test that repeated categorical values share a single string object."""
+    categories = resources.column("Category")
+    lowered = resources.lowered("Category")
+
+    assert categories[0] is categories[1]
+    assert lowered[0] is lowered[1]
+
+
+def test_load_resources_irregular_rows(tmp_path: Path) -> None:
+    """Test that blank lines are skipped and short rows are padded."""
+    csv_path = tmp_path / "resources.csv"
+    csv_path.write_text(
+        "ID,Category,Active\ncmd-001,Slash-Commands,TRUE\n\ncmd-002\n", encoding="utf-8"
+    )
+
+    with patch("scripts.audit.CSV_FILE", str(csv_path)):
+        table, fieldnames = load_resources()
+
+    assert fieldnames == ["ID", "Category", "Active"]
+    assert len(table) == 2
+    assert table.column("Category") == ["Slash-Commands", ""]
+    assert high_level_audit(table)["inactive"] == 1
+
+
+def test_load_resources_missing_file(tmp_path: Path) -> None:
+    """Test that a missing CSV exits with an error."""
+    with (
+        patch("scripts.audit.CSV_FILE", str(tmp_path / "missing.csv")),
+        pytest.raises(SystemExit),
+    ):
+        load_resources()
+
+
+def test_parse_date() -> None:
+    """Test parsing of the CSV timestamp format."""
+    assert parse_date("2025-12-18:05-04-59") == datetime(2025, 12, 18, 5, 4, 59)
+    assert parse_date("") is None
+    assert parse_date("   ") is None
+    assert parse_date("2025-12-18") is None
+    assert parse_date("not a date") is None
+    assert parse_date("2025-13-18:05-04-59") is None
+    assert parse_date("2025-12-18:05-04-5x") is None
+    assert parse_date("2025-1-8:5-4-9") == datetime(2025, 1, 8, 5, 4, 9)
+
+
+def test_dates_parsed_once(resources: ResourceTable) -> None:
+    """Test that date columns are parsed on first use and then reused."""
+    added = resources.dates("Date Added")
+
+    assert isinstance(added[0], datetime)
+    assert added[3] is None
+    assert resources.dates("Last Checked")[2] is None
+    assert resources.dates("Date Added") is added
+
+
+def test_lowered_column(resources: ResourceTable) -> None:
+    """Test that lowercased columns are computed once and reused."""
+    lowered = resources.lowered("Author Name")
+
+    assert lowered == ["alice", "alice", "bob", "carol"]
+    assert resources.lowered("Author Name") is lowered
+
+
+def test_masks(resources: ResourceTable) -> None:
+    """Test the cached per-row flag masks."""
+    active = resources.true_mask("Active")
+
+    assert list(active) == [1, 0, 1, 1]
+    assert resources.true_mask("Active") is active
+    assert list(resources.true_mask("Removed From Origin")) == [0, 1, 0, 0]
+    assert list(resources.missing_mask("License")) == [0, 1, 0, 1]
+
+
+def test_index(resources: ResourceTable) -> None:
+    """Test the lowercased value to row index lookup."""
+    index = resources.index("Category")
+
+    assert index == {"slash-commands": [0, 1], "tooling": [2], "hooks": [3]}
+    assert resources.index("Category") is index
+
+
+def test_high_level_audit(resources: ResourceTable, tmp_path: Path) -> None:
+    """Test repository-wide statistics."""
+    result = high_level_audit(resources)
+
+    assert result["total_resources"] == 4
+    assert result["active"] == 3
+    assert result["inactive"] == 1
+    assert result["categories"] == {"Slash-Commands": 2, "Tooling": 1, "Hooks": 1}
+    assert list(result["categories"]) == ["Slash-Commands", "Tooling", "Hooks"]
+    assert result["no_license"] == 2
+    assert result["unique_authors"] == 4
+    assert result["recently_added"] == 1
+    assert result["recently_checked"] == 1
+    assert result["never_checked"] == 1
+    assert result["outdated_checks"] == 1
+    assert result["removed_from_origin"] == 1
+
+    # Without a License column every resource counts as unlicensed, as in scoped audits
+    csv_path = tmp_path / "no-license.csv"
+    csv_path.write_text("ID,Active\ncmd-001,TRUE\ncmd-002,FALSE\n", encoding="utf-8")
+    with patch("scripts.audit.CSV_FILE", str(csv_path)):
+        table, _ = load_resources()
+
+    assert high_level_audit(table)["no_license"] == 2
+    assert scoped_audit(table, no_license_only=True)["matched_count"] == 2
+
+
+def test_freshness_counts_boundaries() -> None:
+    """Test that freshness cutoffs follow whole-day age thresholds."""
+    now = datetime(2025, 6, 30, 12, 0, 0)
+
+    def ago(days: int, seconds: int = 0) -> str:
+        return (now - timedelta(days=days, seconds=seconds)).strftime("%Y-%m-%d:%H-%M-%S")
+
+    rows = [
+        [ago(30, 86399), ago(7, 86399)],
+        [ago(31), ago(8)],
+        ["", ago(30, 86399)],
+        [ago(0), ago(31)],
+        [ago(400), ""],
+    ]
+    table = ResourceTable(rows, ["Date Added", "Last Checked"])
+
+    # (recently_added, recently_checked, never_checked, outdated)
+    assert freshness_counts(table, now) == (2, 1, 1, 1)
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected_ids"),
+    [
+        ({"category": "slash-commands"}, ["cmd-001", "cmd-002"]),
+        ({"sub_category": "GENERAL"}, ["tool-001", "hook-001"]),
+        ({"author": "alice"}, ["cmd-001", "cmd-002"]),
+        ({"license_filter": "mit"}, ["cmd-001"]),
+        ({"inactive_only": True}, ["cmd-002"]),
+        ({"no_license_only": True}, ["cmd-002", "hook-001"]),
+        ({"recent_days": 30}, ["cmd-001"]),
+        ({"category": "Slash-Commands", "inactive_only": True}, ["cmd-002"]),
+        ({"author": "alice", "no_license_only": True}, ["cmd-002"]),
+        ({"inactive_only": True, "no_license_only": True, "recent_days": 120}, ["cmd-002"]),
+        ({"no_license_only": True, "recent_days": 60}, []),
+        ({"category": "Tooling", "author": "alice"}, []),
+        ({"category": "Nonexistent"}, []),
+    ],
+)
+def test_scoped_audit_filters(
+    resources: ResourceTable, filters: dict[str, Any], expected_ids: list[str]
+) -> None:
+    """Test that scoped filters select the expected resources."""
+    result = scoped_audit(resources, **filters)
+
+    assert result["matched_count"] == len(expected_ids)
+    assert [r["id"] for r in result["resources"]] == expected_ids
+
+
+def test_scoped_audit_resource_details(resources: ResourceTable) -> None:
+    """Test the per-resource details reported by a scoped audit."""
+    result = scoped_audit(resources, category="Tooling")
+
+    assert result["filter_criteria"]["category"] == "Tooling"
+    assert result["resources"] == [
+        {
+            "id": "tool-001",
+            "name": "Usage Monitor",
+            "category": "Tooling",
+            "sub_category": "General",
+            "active": "TRUE",
+            "license": "Apache-2.0",
+            "author": "bob",
+            "primary_link": "https://example.com/usage",
+            "last_checked": "",
+            "days_since_check": None,
+            "removed_from_origin": "FALSE",
+        }
+    ]
+
+    checked = scoped_audit(resources, license_filter="MIT")["resources"][0]
+    assert checked["days_since_check"] == 1
+
+
+def test_print_reports(resources: ResourceTable, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that both reports are written to stdout in full."""
+    print_high_level_report(high_level_audit(resources))
+    out = capsys.readouterr().out
+
+    assert "HIGH-LEVEL AUDIT REPORT" in out
+    assert "  Active: 3 (75.0%)" in out
+    assert "  Slash-Commands: 2" in out
+    assert out.endswith("=" * 80 + "\n\n")
+
+    print_scoped_report(scoped_audit(resources, inactive_only=True))
+    out = capsys.readouterr().out
+
+    assert "  Inactive Only: True" in out
+    assert "📊 MATCHED: 1 resources" in out
+    assert "  1. ✗ Test Runner" in out
+    assert "     ⚠️  REMOVED FROM ORIGIN" in out
+
+
+def test_to_json(resources: ResourceTable) -> None:
+    """Test that JSON output is the same UTF-8 bytes with or without orjson."""
+    resources.columns["Author Name"][0] = "Cihat Gündüz"
+    data = scoped_audit(resources, category="Slash-Commands")
+    encoded = to_json(data)
+
+    assert json.loads(encoded) == data
+    assert encoded.startswith(b'{\n  "filter_criteria": {')
+    assert "Cihat Gündüz".encode() in encoded
+
+    with patch("scripts.audit.orjson", None):
+        assert to_json(data) == encoded
+
+
+def test_audits_use_given_now(resources: ResourceTable) -> None:
+    """Test that both audits measure ages against an explicit ``now``."""
+    later = datetime.now() + timedelta(days=100)
+
+    result = high_level_audit(resources, now=later)
+    assert result["recently_added"] == 0
+    assert result["never_checked"] == 1
+    assert result["outdated_checks"] == 3
+
+    scoped = scoped_audit(resources, license_filter="MIT", now=later)
+    assert scoped["resources"][0]["days_since_check"] == 101
+    assert scoped_audit(resources, recent_days=30, now=later)["matched_count"] == 0
+
+
+def test_scoped_audit_without_details(
+    resources: ResourceTable, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that a count-only scoped audit skips the resource listing."""
+    result = scoped_audit(resources, category="Slash-Commands", include_details=False)
+
+    assert result["matched_count"] == 2
+    assert result["resources"] == []
+
+    print_scoped_report(result)
+    out = capsys.readouterr().out
+    assert "📊 MATCHED: 2 resources" in out
+    assert "RESOURCES:" not in out